@@ -4,23 +4,89 @@ import numpy as np
 from sklearn.cluster import KMeans
 
 
+def flatten_rgb(rgb_image_data: np.ndarray) -> np.ndarray:
+    """Flatten RGB image data into an array of RGB pixels.
+
+    Args:
+        rgb_image_data (np.ndarray): An RGB image as an array, or a flat array of RGB pixels.
+
+    Raises:
+        ValueError: If the provided data does not have exactly 3 channels.
+
+    Returns:
+        np.ndarray: The pixels, as an array of shape (n_pixels, 3).
+    """
+    if rgb_image_data.ndim not in (2, 3) or rgb_image_data.shape[-1] != 3:
+        raise ValueError(f"Expected RGB data with 3 channels; got array of shape {rgb_image_data.shape}")
+    return rgb_image_data.reshape((-1, 3))
+
+
+def sample_pixels(rgb_image_data: np.ndarray, n_samples: int, random_state: int = 0) -> np.ndarray:
+    """Draw a uniform random sample of pixels from the provided RGB image data.
+
+    Fitting a model to a sample is much faster than fitting it to every pixel.
+
+    Args:
+        rgb_image_data (np.ndarray): An RGB image as an array.
+        n_samples (int): The maximum number of pixels to sample; if the image has fewer pixels than this, all
+            pixels are returned.
+        random_state (int, optional): Seed for the random number generator. Defaults to 0.
+
+    Returns:
+        np.ndarray: The sampled pixels, as an array of shape (n_samples, 3).
+    """
+    pixels = flatten_rgb(rgb_image_data)
+    if len(pixels) <= n_samples:
+        return pixels
+    rng = np.random.default_rng(random_state)
+    return pixels[rng.choice(len(pixels), size=n_samples, replace=False)]
+
+
+def fit(rgb_image_data: np.ndarray, n_clusters: int) -> KMeans:
+    """Create a scikit-learn k-means model and fit it to provided data.
+
+    The data is fit in float32 (rather than scikit-learn's default float64), which is plenty of precision for
+    8-bit color values.
+
+    Args:
+        rgb_image_data (np.ndarray): An RGB image as an array, or a flat array of RGB pixels.
+        n_clusters (int): The number of clusters to find in the data.
+
+    Returns:
+        KMeans: The fitted model clusters.
+    """
+    image_rgb_data = flatten_rgb(rgb_image_data).astype(np.float32)
+    clusters = KMeans(n_clusters=n_clusters, random_state=0, n_init="auto")
+    return clusters.fit(image_rgb_data)
+
+
+def predict(cluster_model: KMeans, rgb_image_data: np.ndarray) -> np.ndarray:
+    """Predict the closest cluster for each pixel in the provided data, using a model created by `fit`.
+
+    Args:
+        cluster_model (KMeans): Fitted k-means cluster model.
+        rgb_image_data (np.ndarray): An RGB image as an array, or a flat array of RGB pixels.
+
+    Returns:
+        np.ndarray: The predicted cluster label for each pixel, in row-major order.
+    """
+    return cluster_model.predict(flatten_rgb(rgb_image_data).astype(np.float32))
+
+
 def fit_and_predict(rgb_image_data: np.ndarray, n_clusters: int) -> Tuple[KMeans, np.ndarray]:
     """Create a scikit-learn k-means model and fit to provided data.
 
     Create the model, fit it to the provided RGB image data, and get predictions for the provided data.
 
     Args:
-        rgb_image_data (np.ndarray): An RGB image as an array.
+        rgb_image_data (np.ndarray): An RGB image as an array, or a flat array of RGB pixels.
         n_clusters (int): The number of clusters to find in the data.
 
     Returns:
         Tuple[KMeans, np.ndarray]: The fitted model clusters and the predictions for the provided data.
     """
-    image_size = rgb_image_data.shape[0] * rgb_image_data.shape[1]
-    image_rgb_data = rgb_image_data.reshape((image_size, 3))
-    clusters = KMeans(n_clusters=n_clusters, random_state=0, n_init="auto")
-    predicted = clusters.fit_predict(image_rgb_data)
-    return clusters, predicted
+    clusters = fit(rgb_image_data, n_clusters)
+    return clusters, clusters.labels_
 
 
 def build_histogram_from_clusters(cluster_model: KMeans) -> List[Tuple[np.ndarray, float]]:
@@ -33,13 +99,8 @@ def build_histogram_from_clusters(cluster_model: KMeans) -> List[Tuple[np.ndarra
         List[Tuple[np.ndarray, float]]: A histogram (distribution) of predictions and their associated
             proportions.
     """
-    bins = np.arange(0, len(cluster_model.cluster_centers_) + 1)  # bins by label ([0, 1, 2, 3, ...])
-    histogram, _ = np.histogram(cluster_model.labels_, bins=bins)  # array of counts by label
-    histogram = histogram.astype("float32")
-    histogram /= histogram.sum()  # array of proportions
-    color_and_proportion = list(zip(cluster_model.cluster_centers_, histogram))  # cluster centers are RGB colors
-
-    return [
-        (rgb_color, proportion)
-        for rgb_color, proportion in sorted(color_and_proportion, key=lambda x: x[1], reverse=True)
-    ]
+    counts = np.bincount(cluster_model.labels_, minlength=len(cluster_model.cluster_centers_))  # counts by label
+    proportions = counts.astype("float32") / counts.sum()
+    order = np.argsort(-counts, kind="stable")  # most common first
+
+    return [(cluster_model.cluster_centers_[i], proportions[i]) for i in order]
@@ -7,14 +7,16 @@
 #     https://github.com/baptiste0928/dominant-color/blob/main/src/lib.rs#L27
 
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import List, Tuple, Union
 
 import numpy as np
 from PIL import Image
 
+import colortools.config as config
 import colortools.util as util
-from colortools.analysis import build_histogram_from_clusters, fit_and_predict
+from colortools.analysis import build_histogram_from_clusters, fit, predict, sample_pixels
 from colortools.heuristics import NColorsHeuristic, compute_hue_dist, get_n_heuristic
 
 logging.basicConfig(format="%(levelname)s: %(message)s")
@@ -52,8 +54,8 @@ class AnalyzedImage:
         self.dominant_color_algorithm = dominant_color_algorithm
 
         # set image, dimensions, and orientation
-        pil_image = Image.open(image_path)
-        original_width, original_height = pil_image.size
+        with Image.open(image_path) as pil_image:
+            original_width, original_height = pil_image.size
         if original_height > original_width:
             self.orientation = util.ImageOrientation.VERTICAL
             resized_height = resize_long_axis if resize_long_axis is not None else original_height
@@ -63,9 +65,11 @@ class AnalyzedImage:
             resized_width = resize_long_axis if resize_long_axis is not None else original_width
             resized_height = int((original_height / original_width) * resized_width)
 
-        self.pil_image = pil_image.resize((resized_width, resized_height))
-        self.width, self.height = self.pil_image.size
+        self._pil_image = self.load_image(resized_width, resized_height)
+        self.width, self.height = self._pil_image.size
         self.edge_crop = edge_crop
+        self._rgb_array = None
+        self._hsv_array = None
 
         # set n, if not provided
         if n_colors is None or n_colors == 0:
@@ -91,6 +95,70 @@ class AnalyzedImage:
         else:
             raise ValueError(f"Unrecognized dominant color algorithm: {self.dominant_color_algorithm}")
 
+        # cache the most dominant color in HSV space, which is looked up repeatedly when sorting
+        self._dominant_color_hsv = self.get_dominant_colors(hsv=True)[0]
+        self._dominant_color_hsv_rounded = self.get_dominant_colors(hsv=True, round=True)[0]
+
+    @property
+    def pil_image(self) -> Image.Image:
+        """This image, resized for analysis. Reloaded from disk if it was released with `release_image()`.
+
+        Returns:
+            Image.Image: This image, resized for analysis.
+        """
+        if self._pil_image is None:
+            self._pil_image = self.load_image(self.width, self.height)
+        return self._pil_image
+
+    def load_image(self, width: int, height: int) -> Image.Image:
+        """Load this image from disk, resize it to the provided dimensions, and convert it to RGB if needed.
+
+        Args:
+            width (int): The target width.
+            height (int): The target height.
+
+        Returns:
+            Image.Image: The loaded and resized image.
+        """
+        with Image.open(self.image_path) as pil_image:
+            # let the JPEG decoder downscale while decoding, rather than decoding at full resolution
+            pil_image.draft("RGB", (width, height))
+            resized = pil_image.resize((width, height), resample=Image.Resampling.BILINEAR, reducing_gap=2.0)
+        if resized.mode != "RGB":
+            resized = resized.convert("RGB")  # e.g. grayscale or CMYK JPEGs
+        return resized
+
+    def release_arrays(self):
+        """Release this image's cached RGB and HSV arrays, keeping the resized image itself.
+
+        The arrays are recomputed from the resized image if they are needed again.
+        """
+        self._rgb_array = None
+        self._hsv_array = None
+
+    def release_image(self):
+        """Release this image's pixel data, keeping only its metadata and analysis results.
+
+        Useful for reducing memory usage when analyzing many images. The pixel data is reloaded from disk if
+        it is needed again (e.g. for remapping or visualization).
+        """
+        self._pil_image = None
+        self.release_arrays()
+
+    def __getstate__(self) -> dict:
+        """Get the state to pickle for this image, e.g. when returning it from a worker process.
+
+        Cached pixel arrays and predictions are left out, since they are large and can be recomputed on demand.
+
+        Returns:
+            dict: The state of this image, without cached arrays.
+        """
+        state = self.__dict__.copy()
+        state["_rgb_array"] = None
+        state["_hsv_array"] = None
+        state.pop("predicted", None)
+        return state
+
     def get_dominant_colors_hue_dist(self, n_colors: int) -> Tuple[List, List]:
         """Get dominant colors using the HUE_DIST algorithm.
 
@@ -101,23 +169,21 @@ class AnalyzedImage:
             Tuple[List, List]: The dominant colors (RGB values, HSV values).
         """
         hue_dist = compute_hue_dist(self.get_as_array(hsv=True, crop_center=True))
-        hue_dist = [
-            (hue, hsv_list) for hue, hsv_list in sorted(hue_dist.items(), key=lambda item: len(item[1]), reverse=True)
-        ]
+        hue_counts = np.array([len(hue_pixels) for hue_pixels in hue_dist.values()])
+        dominant_hues = np.argsort(-hue_counts, kind="stable")[:n_colors]
 
         dominant_colors_hsv = []
-        for i in range(n_colors):
-            current_hue_list = hue_dist[i]
-            hue = current_hue_list[0]
-            if len(current_hue_list[1]) > 0:
-                avg_sat = np.median([hsv[1] for hsv in current_hue_list[1]])
-                avg_val = np.median([hsv[2] for hsv in current_hue_list[1]])
+        for hue in dominant_hues:
+            hue_pixels = hue_dist[int(hue)]
+            if len(hue_pixels) > 0:
+                avg_sat = np.median(hue_pixels[:, 1])
+                avg_val = np.median(hue_pixels[:, 2])
             else:
                 logging.warning(
                     f"No pixels found for hue value {hue}; n_colors may be larger than number of hues in image."
                 )
                 avg_sat, avg_val = 0, 0
-            dominant_colors_hsv.append([hue, avg_sat, avg_val])
+            dominant_colors_hsv.append([int(hue), avg_sat, avg_val])
 
         dominant_colors_hsv = util.normalize_8bit_hsv(dominant_colors_hsv)
         dominant_colors_rgb = util.hsv_to_rgb(dominant_colors_hsv)
@@ -126,21 +192,36 @@ class AnalyzedImage:
     def get_dominant_colors_kmeans(self, n_colors: int) -> Tuple[List, List]:
         """Get dominant colors using the KMEANS algorithm.
 
+        The model is fit to a sample of this image's pixels; predictions for the full image are only computed
+        when `predicted` is first accessed (e.g. when remapping).
+
         Args:
             n_colors (int): The number of dominant colors to compute.
 
         Returns:
             Tuple[List, List]: The dominant colors (RGB values, HSV values).
         """
-        self.model, self.predicted = fit_and_predict(self.get_as_array(crop_center=True), n_colors)
+        pixel_sample = sample_pixels(self.get_as_array(crop_center=True), config.DEFAULT_KMEANS_SAMPLE_SIZE)
+        self.model = fit(pixel_sample, n_colors)
         self.cluster_histogram = build_histogram_from_clusters(self.model)
         dominant_colors_rgb = [rgb.tolist() for rgb, _ in self.cluster_histogram]
         dominant_colors_hsv = util.rgb_to_hsv(dominant_colors_rgb)
         return dominant_colors_rgb, dominant_colors_hsv
 
+    @cached_property
+    def predicted(self) -> np.ndarray:
+        """The cluster predicted by this image's model for each of its pixels, computed on first access.
+
+        Returns:
+            np.ndarray: The predicted cluster label for each pixel, in row-major order.
+        """
+        return predict(self.model, self.get_as_array())
+
     def get_as_array(self, hsv=False, crop_center=False) -> np.ndarray:
         """Get this image as a NumPy array.
 
+        The converted arrays are cached, so that the image is only converted once per color space.
+
         Args:
             hsv (bool, optional): Whether to convert pixels to HSV space before returning. Defaults to False.
 
@@ -148,9 +229,15 @@ class AnalyzedImage:
             np.ndarray: This image as a NumPy array.
         """
         if hsv:
-            as_array = np.asarray(self.pil_image.convert("HSV"))
+            if self._hsv_array is None:
+                # Pillow's single-pass C conversion is deliberately kept here; an equivalent NumPy conversion
+                # from the RGB array needs several full-size temporaries and measured ~7x slower
+                self._hsv_array = util.pil_image_to_array(self.pil_image.convert("HSV"))
+            as_array = self._hsv_array
         else:
-            as_array = np.asarray(self.pil_image)
+            if self._rgb_array is None:
+                self._rgb_array = util.pil_image_to_array(self.pil_image)
+            as_array = self._rgb_array
 
         if crop_center:
             return util.crop_center(as_array, self.edge_crop)
@@ -182,6 +269,8 @@ class AnalyzedImage:
         Returns:
             List: _description_
         """
+        if hsv:
+            return self._dominant_color_hsv_rounded if round else self._dominant_color_hsv
         return self.get_dominant_colors(hsv, round)[0]
 
     def get_orientation(self) -> util.ImageOrientation:
@@ -222,17 +311,16 @@ class AnalyzedImage:
                 model, if present, else None.
         """
         if self.dominant_color_algorithm == util.DominantColorAlgorithm.KMEANS:
-            target_colors = self.model.cluster_centers_
+            # round the (few) cluster centers to 8-bit colors once, rather than every remapped pixel
+            target_colors = np.rint(self.model.cluster_centers_).astype(np.uint8)
             if other is None:
                 height, width = self.height, self.width
-                other_rgb_data = self.get_as_array().reshape((height * width, 3))
+                other_predicted = self.predicted
             else:
                 height, width = other.height, other.width
-                other_rgb_data = other.get_as_array().reshape((height * width, 3))
+                other_predicted = predict(self.model, other.get_as_array())
 
-            other_predicted = self.model.predict(other_rgb_data)
-            remapped_image = np.array([target_colors[i] for i in other_predicted])
-            return Image.fromarray(np.uint8(remapped_image.reshape((height, width, 3))))
+            return Image.fromarray(target_colors[other_predicted].reshape((height, width, 3)))
         else:
             raise ValueError(f"Cannot remap images using the {self.dominant_color_algorithm.value} algorithm")
 
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 import argparse
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List
 
+from threadpoolctl import threadpool_limits
 from tqdm import tqdm
 
 import colortools.config as config
@@ -60,6 +64,12 @@ def parse_args(args: List[str]) -> argparse.Namespace:
         action="store_true",
         help="Analyze images in their entirety, without any edge cropping.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=config.DEFAULT_N_JOBS,
+        help="number of worker processes to use for image analysis (default: number of CPUs)",
+    )
     parser.add_argument(
         "--exclude_bw",
         "--exclude-bw",
@@ -143,6 +153,9 @@ def check_args(args: argparse.Namespace) -> argparse.Namespace:
     if args.exclude_bw and args.exclude_color:
         logging.error("Cannot set both --exclude_bw and --exclude_color")
         return None
+    if args.jobs is not None and args.jobs < 1:
+        logging.error("--jobs must be at least 1")
+        return None
     if args.spectrum_all_colors:
         args.spectrum = True
     if not (
@@ -175,6 +188,7 @@ def print_verbose_output(args: argparse.Namespace):
     print(f"- n_colors={args.n_colors}")
     print(f"- n_colors_heuristic={args.n_colors_heuristic}")
     print(f"- skip_analysis_crop={args.skip_analysis_crop}")
+    print(f"- jobs={args.jobs}")
     print()
 
     print("Action summary:")
@@ -218,6 +232,63 @@ def print_verbose_output(args: argparse.Namespace):
     print()
 
 
+def analyze_image(jpg_path: Path, args: argparse.Namespace) -> AnalyzedImage:
+    """Analyze a single image using the settings in the provided arguments.
+
+    Defined at module level so that it can be run in worker processes. The image's cached pixel arrays are
+    always released, and the image itself is released too unless a selected output needs it.
+
+    Args:
+        jpg_path (Path): The path to the .jpg image to analyze.
+        args (argparse.Namespace): The arguments for this run of ColorTools.
+
+    Returns:
+        AnalyzedImage: The analyzed image.
+    """
+    analyzed_image = AnalyzedImage(
+        image_path=jpg_path,
+        resize_long_axis=config.DEFAULT_RESIZE_LONG_AXIS,
+        edge_crop=0 if args.skip_analysis_crop else config.DEFAULT_EDGE_CROP,
+        dominant_color_algorithm=args.algorithm,
+        n_colors=args.n_colors,
+        auto_n_heuristic=args.n_colors_heuristic,
+    )
+    analyzed_image.release_arrays()
+    if not (args.dominant_colors or args.dominant_colors_remapped or args.collage):
+        analyzed_image.release_image()
+    return analyzed_image
+
+
+def init_worker():
+    """Limit a worker process's native thread pools (e.g. scikit-learn's OpenMP threads) to a single thread.
+
+    The worker processes already use every CPU between them, so letting each one also start a thread per CPU
+    would oversubscribe the machine.
+    """
+    threadpool_limits(limits=1)
+
+
+def analyze_images(jpg_paths: List[Path], args: argparse.Namespace) -> List[AnalyzedImage]:
+    """Analyze a list of images, in parallel worker processes unless `args.jobs` is 1.
+
+    No more worker processes are started than there are images.
+
+    Args:
+        jpg_paths (List[Path]): The paths to the .jpg images to analyze.
+        args (argparse.Namespace): The arguments for this run of ColorTools.
+
+    Returns:
+        List[AnalyzedImage]: The analyzed images, in the same order as the provided paths.
+    """
+    n_workers = min(args.jobs or os.cpu_count() or 1, len(jpg_paths))
+    if n_workers <= 1:
+        return [analyze_image(jpg_path, args) for jpg_path in tqdm(jpg_paths, ascii=True)]
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=init_worker) as executor:
+        analyzed_images = executor.map(analyze_image, jpg_paths, repeat(args))
+        return list(tqdm(analyzed_images, total=len(jpg_paths), ascii=True))
+
+
 def run():
     args = check_args(parse_args(sys.argv[1:]))
     if args:
@@ -232,19 +303,7 @@ def run():
             print(f"No images found in {args.input}")
         else:
             print(f"Analyzing {n_jpg_paths} images...")
-            analyzed_images = []
-            edge_crop = 0 if args.skip_analysis_crop else config.DEFAULT_EDGE_CROP
-            for jpg_path in tqdm(jpg_paths, ascii=True):
-                analyzed_images.append(
-                    AnalyzedImage(
-                        image_path=jpg_path,
-                        resize_long_axis=config.DEFAULT_RESIZE_LONG_AXIS,
-                        edge_crop=edge_crop,
-                        dominant_color_algorithm=args.algorithm,
-                        n_colors=args.n_colors,
-                        auto_n_heuristic=args.n_colors_heuristic,
-                    )
-                )
+            analyzed_images = analyze_images(jpg_paths, args)
 
             if args.exclude_bw:
                 analyzed_images, _ = sort.separate_color_and_bw(analyzed_images)
@@ -7,10 +7,12 @@ DEFAULT_DOMINANT_COLOR_CHIP_GAP = 10
 DEFAULT_DOMINANT_COLOR_CHIP_SIZE = 80
 DEFAULT_DOMINANT_COLOR_DIR = "dominant_colors/"
 DEFAULT_EDGE_CROP = 0.05
+DEFAULT_KMEANS_SAMPLE_SIZE = 10000
 DEFAULT_N_COLORS = None
 DEFAULT_N_COLORS_HEURISTIC = "auto_n_binned_with_threshold"
 DEFAULT_N_COLORS_MAX = 8
 DEFAULT_N_COLORS_MIN = 2
+DEFAULT_N_JOBS = None
 DEFAULT_OUTPUT_DIR = "output/"
 DEFAULT_RESIZE_LONG_AXIS = 500
 DEFAULT_SORT_METHOD = "hue"
@@ -56,22 +56,24 @@ def compute_hue_dist(image_hsv: np.ndarray, n_bins: int = PIL_NUM_HUES, hue_coun
 
     Returns:
         Dict: A distribution of hues represented by a dictionary, where keys are discrete hue values and values
-            are either lists of pixel representations or the lengths of those lists.
+            are either arrays of pixel representations (with shape (count, 3)) or the lengths of those arrays.
     """
-    flattened_hsv = image_hsv.reshape((image_hsv.shape[0] * image_hsv.shape[1], 3))
+    flattened_hsv = image_hsv.reshape((-1, 3))
     n_bins = min(n_bins, PIL_NUM_HUES)
 
-    hue_dist = {i: [] for i in range(n_bins)}
-    try:
-        for hsv in flattened_hsv:
-            hue_dist[int(hsv[0] / (PIL_NUM_HUES / n_bins))].append(hsv)
-    except KeyError as e:
-        raise ValueError(f"Invalid hue value ({hsv[0]}: {e}")
+    hue_bins = (flattened_hsv[:, 0] / (PIL_NUM_HUES / n_bins)).astype(int)
+    invalid_hues = (hue_bins < 0) | (hue_bins >= n_bins)
+    if invalid_hues.any():
+        raise ValueError(f"Invalid hue value: {flattened_hsv[invalid_hues][0, 0]}")
 
+    hue_counts = np.bincount(hue_bins, minlength=n_bins)
     if hue_counts_only:
-        hue_dist = {i: len(v) for i, v in hue_dist.items()}
+        return {i: int(count) for i, count in enumerate(hue_counts)}
 
-    return hue_dist
+    # sort pixels by hue bin once, so that the pixels for each bin form a contiguous segment; there are at most
+    # 256 bins, and NumPy's stable sort of 8-bit integers is a linear-time radix sort
+    sorted_hsv = flattened_hsv[np.argsort(hue_bins.astype(np.uint8), kind="stable")]
+    return dict(enumerate(np.split(sorted_hsv, np.cumsum(hue_counts)[:-1])))
 
 
 def auto_n_hue(image_hsv: np.ndarray) -> int:
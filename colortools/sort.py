@@ -1,5 +1,4 @@
 import logging
-from collections import deque
 from enum import Enum
 from typing import Callable, List, Tuple
 
@@ -69,18 +68,13 @@ def orient_to_sort_anchor(sorted_analyzed_images: List[AnalyzedImage], sort_anch
     """
     starting_index = 0
     if sort_anchor:
-        try:
-            while not sorted_analyzed_images[starting_index].image_path.name == sort_anchor:
-                starting_index += 1
-        except IndexError:
+        image_names = [img.image_path.name for img in sorted_analyzed_images]
+        if sort_anchor in image_names:
+            starting_index = image_names.index(sort_anchor)
+        else:
             logging.warning(f"Starting image {sort_anchor} not found!")
-            starting_index = 0
-
-    sorted_analyzed_images = deque(sorted_analyzed_images)
-    for _ in range(starting_index):
-        sorted_analyzed_images.append(sorted_analyzed_images.popleft())
 
-    return list(sorted_analyzed_images)
+    return sorted_analyzed_images[starting_index:] + sorted_analyzed_images[:starting_index]
 
 
 def huesort(analyzed_images: List[AnalyzedImage], sort_reverse: bool, sort_anchor: str) -> List[AnalyzedImage]:
@@ -115,10 +109,7 @@ def huesort(analyzed_images: List[AnalyzedImage], sort_reverse: bool, sort_ancho
     bw.sort(key=lambda elem: elem.get_dominant_color(hsv=True, round=True)[2], reverse=sort_reverse)
 
     color = orient_to_sort_anchor(color, sort_anchor)
-    combined = []
-    combined.extend(color)
-    combined.extend(bw)  # bw always at end
-    return combined
+    return color + bw  # bw always at end
 
 
 def satsort(analyzed_images: List[AnalyzedImage], sort_reverse: bool, sort_anchor: str) -> List[AnalyzedImage]:
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import List, Union
 
 import numpy as np
+from PIL import Image
 
 DIGIT_RE = re.compile(r"(\d+)")
 
@@ -151,6 +152,21 @@ def normalize_8bit_hsv(hsv_list: Union[List[int], List[List[int]]]) -> Union[Lis
     return normalized
 
 
+def pil_image_to_array(pil_image: Image.Image) -> np.ndarray:
+    """Get a read-only NumPy view of a PIL image's pixel data.
+
+    Wraps the image's raw bytes directly, which is cheaper than going through `np.asarray(pil_image)`.
+
+    Args:
+        pil_image (Image.Image): The image to convert.
+
+    Returns:
+        np.ndarray: The image's pixel data, with shape (height, width, bands).
+    """
+    n_bands = len(pil_image.getbands())
+    return np.frombuffer(pil_image.tobytes(), dtype=np.uint8).reshape((pil_image.height, pil_image.width, n_bands))
+
+
 def crop_center(rgb_image_data: np.ndarray, border_percent_y: float, border_percent_x: float = None) -> np.ndarray:
     """Crop the borders of an image, leaving only the center.
 
@@ -1,12 +1,35 @@
 import numpy as np
 import pytest
 from PIL import Image
-from colortools.analysis import fit_and_predict
+from colortools.analysis import build_histogram_from_clusters, fit_and_predict, flatten_rgb, sample_pixels
 
 
 @pytest.mark.parametrize("test_side_length, color", [(100, (255, 0, 0)), (100, (0, 255, 0)), (100, (0, 0, 255))])
 def test_analyzed_image_resize(test_side_length, color):
     image = Image.new("RGB", (test_side_length, test_side_length), color)
     clusters, predicted = fit_and_predict(np.asarray(image), 1)
-    assert (clusters.cluster_centers_ == [list(color)]).all()
+    np.testing.assert_allclose(clusters.cluster_centers_, [list(color)], rtol=1e-5)  # fit in float32
     assert (predicted == [0] * image.size[0] * image.size[1]).all()
+
+
+@pytest.mark.parametrize("test_side_length, n_samples, expected_length", [(10, 1000, 100), (100, 1000, 1000)])
+def test_sample_pixels(test_side_length, n_samples, expected_length):
+    image_data = np.arange(test_side_length * test_side_length * 3).reshape((test_side_length, test_side_length, 3))
+    sample = sample_pixels(image_data, n_samples)
+    assert sample.shape == (expected_length, 3)
+    assert len(np.unique(sample[:, 0])) == expected_length  # no pixel sampled twice
+    assert np.isin(sample, image_data).all()
+
+
+def test_build_histogram_from_clusters():
+    image_data = np.array([[[255, 0, 0]] * 25 + [[0, 0, 255]] * 75], dtype=np.uint8)
+    clusters, _ = fit_and_predict(image_data, 2)
+    histogram = build_histogram_from_clusters(clusters)
+    np.testing.assert_allclose([color for color, _ in histogram], [[0, 0, 255], [255, 0, 0]], rtol=1e-5)
+    np.testing.assert_allclose([proportion for _, proportion in histogram], [0.75, 0.25])
+
+
+@pytest.mark.parametrize("shape", [(10, 10), (10, 10, 1), (10, 10, 4), (10, 4)])
+def test_flatten_rgb_bad_shape(shape):
+    with pytest.raises(ValueError):
+        _ = flatten_rgb(np.zeros(shape, dtype=np.uint8))
@@ -115,3 +115,43 @@ def test_generate_filename(n_colors, index, base):
         assert f"{str(index)}_" in test_filename
     assert f"{str(base)}_" in test_filename
     assert f"_n={str(n_colors)}.jpg" in test_filename
+
+
+@pytest.mark.parametrize("dominant_color_algorithm", DOMINANT_COLOR_ALGORITHMS)
+def test_release_image(dominant_color_algorithm):
+    image_path = get_image_path((100, 200), "red")
+    analyzed_image = AnalyzedImage(image_path, 50, EDGE_CROP, dominant_color_algorithm, 1, None)
+    dominant_colors = analyzed_image.get_dominant_colors()
+    analyzed_image.release_image()
+    assert analyzed_image.pil_image.size == (25, 50)  # reloaded from disk
+    assert analyzed_image.get_as_array().shape == (50, 25, 3)
+    assert analyzed_image.get_dominant_colors() == dominant_colors
+
+
+def test_release_arrays():
+    image_path = get_image_path((100, 200), "red")
+    analyzed_image = AnalyzedImage(image_path, 50, EDGE_CROP, DominantColorAlgorithm.KMEANS, 1, None)
+    pil_image = analyzed_image.pil_image
+    analyzed_image.release_arrays()
+    assert analyzed_image._rgb_array is None and analyzed_image._hsv_array is None
+    assert analyzed_image.pil_image is pil_image  # image itself is kept
+    assert analyzed_image.get_as_array().shape == (50, 25, 3)
+
+
+def test_get_remapped_image():
+    image_path = f"{TEST_IMAGE_DIR}/red-blue.jpg"
+    analyzed_image = AnalyzedImage(image_path, None, EDGE_CROP, DominantColorAlgorithm.KMEANS, 2, None)
+    remapped = np.asarray(analyzed_image.get_remapped_image())
+    assert remapped.shape == (analyzed_image.height, analyzed_image.width, 3)
+    assert remapped.dtype == np.uint8
+    dominant_colors = np.rint(analyzed_image.get_dominant_colors())
+    assert {tuple(color) for color in remapped.reshape((-1, 3))} == {tuple(color) for color in dominant_colors}
+
+
+@pytest.mark.parametrize("dominant_color_algorithm", DOMINANT_COLOR_ALGORITHMS)
+@pytest.mark.parametrize("color_name, target_rgb", [("red-cmyk", [255, 0, 0]), ("gray-grayscale", [128, 128, 128])])
+def test_non_rgb_jpg(dominant_color_algorithm, color_name, target_rgb):
+    image_path = get_image_path((100, 100), color_name)
+    analyzed_image = AnalyzedImage(image_path, None, EDGE_CROP, dominant_color_algorithm, 1, None)
+    assert analyzed_image.pil_image.mode == "RGB"
+    np.testing.assert_allclose(analyzed_image.get_dominant_color(), target_rgb, atol=2)
@@ -0,0 +1,35 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from colortools.cli import analyze_images, check_args, init_worker, parse_args
+from threadpoolctl import threadpool_info
+from colortools.util import collect_jpg_paths
+
+TEST_IMAGE_DIR = "tests/test_images/test_sort"
+
+
+@pytest.mark.parametrize("jobs", [0, -1])
+def test_check_args_bad_jobs(jobs):
+    args = parse_args([TEST_IMAGE_DIR, "--summary", "--jobs", str(jobs)])
+    assert check_args(args) is None
+
+
+@pytest.mark.parametrize("algorithm", ["hue_dist", "kmeans"])
+def test_analyze_images_jobs(algorithm):
+    jpg_paths = collect_jpg_paths(TEST_IMAGE_DIR)
+    serial_args = check_args(parse_args([TEST_IMAGE_DIR, "--summary", "--algorithm", algorithm, "--jobs", "1"]))
+    parallel_args = check_args(parse_args([TEST_IMAGE_DIR, "--summary", "--algorithm", algorithm, "--jobs", "2"]))
+
+    serial_results = analyze_images(jpg_paths, serial_args)
+    parallel_results = analyze_images(jpg_paths, parallel_args)
+
+    assert [image.image_path for image in serial_results] == jpg_paths
+    assert [image.image_path for image in parallel_results] == jpg_paths
+    for serial_image, parallel_image in zip(serial_results, parallel_results):
+        assert serial_image.get_dominant_colors() == parallel_image.get_dominant_colors()
+
+
+def test_init_worker():
+    with ProcessPoolExecutor(max_workers=1, initializer=init_worker) as executor:
+        worker_threadpools = executor.submit(threadpool_info).result()
+    assert all(threadpool["num_threads"] == 1 for threadpool in worker_threadpools)
@@ -1,5 +1,6 @@
 import pytest
 from colortools.heuristics import (
+    PIL_NUM_HUES,
     auto_n_binned_with_threshold,
     auto_n_hue,
     auto_n_hue_binned,
@@ -30,6 +31,17 @@ def test_get_hue_dist_simple(n_hues, n_bins, expected_count):
     assert hue_dist == expected
 
 
+@pytest.mark.parametrize("n_hues, n_bins", [(10, 2), (129, 2), (256, 8)])
+def test_get_hue_dist_pixels(n_hues, n_bins):
+    test_input = get_hsv_array(n_hues)
+    hue_dist = compute_hue_dist(test_input, n_bins)
+    hue_counts = compute_hue_dist(test_input, n_bins, hue_counts_only=True)
+    assert list(hue_dist.keys()) == list(range(n_bins))
+    for i, hue_pixels in hue_dist.items():
+        assert hue_pixels.shape == (hue_counts[i], 3)
+        assert (hue_pixels[:, 0] // (PIL_NUM_HUES // n_bins) == i).all()
+
+
 def test_get_hue_dist_exception():
     test_input = get_hsv_array(257)
     with pytest.raises(ValueError):
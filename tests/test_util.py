@@ -4,6 +4,7 @@ from pathlib import Path
 import colortools.util as util
 import numpy as np
 import pytest
+from PIL import Image
 
 from conftest import ARRAY_TOLERANCE
 
@@ -248,6 +249,12 @@ def test_crop_center_odd_dims(crop_y, crop_x, expected):
     np.testing.assert_array_equal(result, expected)
 
 
+@pytest.mark.parametrize("mode", ["RGB", "HSV"])
+def test_pil_image_to_array(mode):
+    image = Image.fromarray(np.arange(4 * 6 * 3, dtype=np.uint8).reshape((4, 6, 3))).convert(mode)
+    np.testing.assert_array_equal(util.pil_image_to_array(image), np.asarray(image))
+
+
 @pytest.mark.parametrize("test_rgb, test_hsv", RGB_HSV_PAIRS)
 def test_hsv_to_rgb(test_rgb, test_hsv):
     np.testing.assert_allclose(util.hsv_to_rgb(test_hsv), test_rgb, atol=ARRAY_TOLERANCE)